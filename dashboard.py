@@ -3,6 +3,8 @@ AppPulse Business Insights Dashboard
 Streamlit Application
 """
 
+import os
+import tempfile
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -18,96 +20,121 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS with increased font sizes
-st.markdown("""
-<style>
-    .main {
-        padding-top: 2rem;
-        font-size: 30px;
-    }
-    .stMetric {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-    }
-    .stMetric label {
-        font-size: 26px !important;
-    }
-    .stMetric [data-testid="stMetricValue"] {
-        font-size: 42px !important;
-    }
-    .stMetric [data-testid="stMetricDelta"] {
-        font-size: 22px !important;
-    }
-    h1 {
-        color: #667eea;
-        font-size: 58px !important;
-    }
-    h2 {
-        font-size: 52px !important;
-    }
-    h3 {
-        font-size: 42px !important;
-    }
-    p, .stMarkdown, div {
-        font-size: 30px !important;
-    }
-    .success-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        color: white;
-    }
-    .success-card h4 {
-        font-size: 36px !important;
-    }
-    .success-card p {
-        font-size: 30px !important;
-    }
-    .stDataFrame {
-        font-size: 30px !important;
-    }
-    .stDataFrame th {
-        font-size: 30px !important;
-    }
-    .stDataFrame td {
-        font-size: 30px !important;
-    }
-    .sidebar .sidebar-content {
-        font-size: 30px !important;
-    }
-    .stSelectbox label, .stSlider label, .stTextInput label {
-        font-size: 30px !important;
-    }
-    .stTab {
-        font-size: 32px !important;
-    }
-    button {
-        font-size: 30px !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css():
+    """Read the custom stylesheet once per server process"""
+    with open('style.css') as f:
+        return f.read()
+
+# Custom CSS with increased font sizes, kept in style.css. The markdown call
+# itself has to run on every rerun because Streamlit rebuilds the page each
+# time; the frontend skips re-rendering it when the content is unchanged.
+st.markdown(f"<style>\n{load_css()}</style>", unsafe_allow_html=True)
 
 # =============================================================================
 # DATA LOADING
 # =============================================================================
 
-@st.cache_data
-def load_data():
-    """Load app data"""
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ('Category', 'Type', 'Content Rating')
+
+# Count columns downcast to the smallest unsigned integer type that holds
+# their values, which is lossless. Float columns stay float64: they are
+# displayed and exported as-is, and float32 keeps only ~7 significant digits.
+COUNT_COLUMNS = ('Reviews', 'Installs_Clean')
+
+def optimize_dtypes(df):
+    """Shrink column dtypes so filtering and groupby touch less memory"""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in COUNT_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='unsigned')
+    return df
+
+# Locations the raw app CSV is read from, in order of preference
+CSV_PATH = 'apps_with_features.csv'
+FALLBACK_CSV_PATH = 'data/apps_with_features.csv'
+
+# Columnar copy of the loaded CSV, written on a cold start so later starts
+# skip text parsing
+PARQUET_PATH = 'apps_with_features.parquet'
+
+def read_csv_data():
+    """Read the raw app CSV from the first location that exists"""
     try:
         # # Try to load from multiple possible locations
         # df = pd.read_csv('apps_with_features.csv')
         # Load data with sample for faster deployment
-        df = pd.read_csv('apps_with_features.csv', nrows=5000)  # Only load first 5000 rows
-        return df
+        return pd.read_csv(CSV_PATH, nrows=5000)  # Only load first 5000 rows
     except:
         try:
-            df = pd.read_csv('data/apps_with_features.csv')
-            return df
+            return pd.read_csv(FALLBACK_CSV_PATH)
         except:
+            return None
+
+def parquet_is_current():
+    """Whether the Parquet copy is newer than its source CSV and this script"""
+    try:
+        built = os.path.getmtime(PARQUET_PATH)
+    except OSError:
+        return False
+    # This script defines the dtypes the copy was written with, so editing
+    # optimize_dtypes() invalidates it just like editing the CSV does
+    sources = [__file__] + [path for path in (CSV_PATH, FALLBACK_CSV_PATH) if os.path.exists(path)]
+    return all(built >= os.path.getmtime(path) for path in sources)
+
+def write_parquet_copy(df):
+    """Write the Parquet copy atomically so readers never see a partial file"""
+    # The temp file sits next to the target so os.replace() stays a same-filesystem rename
+    fd, tmp_path = tempfile.mkstemp(suffix='.parquet', dir=os.path.dirname(os.path.abspath(PARQUET_PATH)))
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='snappy', index=False)
+        os.replace(tmp_path, PARQUET_PATH)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+# cache_resource hands every caller the same frame without a pickle round
+# trip, so it must be treated as read-only; derive new frames, never mutate it
+@st.cache_resource
+def load_data():
+    """Load app data"""
+    df = None
+    if parquet_is_current():
+        try:
+            # Parquet keeps the optimized dtypes, categoricals included
+            df = pd.read_parquet(PARQUET_PATH, engine='pyarrow')
+        except Exception:
+            # Missing pyarrow or an unreadable copy: rebuild it from the CSV below
+            df = None
+
+    if df is None:
+        df = read_csv_data()
+        if df is None:
             st.error(" Data file not found. Please place 'apps_with_features.csv' in the app directory.")
             return None
+        df = optimize_dtypes(df)
+        try:
+            write_parquet_copy(df)
+        except (ImportError, OSError):
+            # Read-only or pyarrow-less deployments keep parsing the CSV
+            pass
+    # Lowercased once here so the search box can match without case folding per keystroke
+    df['_app_lower'] = df['App'].str.lower()
+    return df
+
+@st.cache_data
+def global_stats():
+    """Whole-dataset aggregates that don't depend on the sidebar filters"""
+    df = load_data()
+    return {
+        'n': len(df),
+        'mean_rating': df['Rating'].mean(),
+        'categories': sorted(df['Category'].dropna().unique().tolist())
+    }
 
 # Load data
 df = load_data()
@@ -115,6 +142,135 @@ df = load_data()
 if df is None:
     st.stop()
 
+stats = global_stats()
+
+# =============================================================================
+# FILTERED DATA
+# =============================================================================
+# Cached on the primitive sidebar values rather than on a DataFrame, so the
+# cache key is a cheap tuple hash and revisiting a filter combination skips
+# both the filtering and the aggregations below.
+
+@st.cache_data
+def filter_df(category, app_type, min_rating, min_reviews):
+    """Apply the sidebar filters as one combined mask so the frame is only indexed once"""
+    df = load_data()
+    mask = (df['Rating'] >= min_rating) & (df['Reviews'] >= min_reviews)
+
+    if category != 'All Categories':
+        mask &= df['Category'] == category
+
+    if app_type != 'All Types':
+        mask &= df['Type'] == app_type
+
+    return df.loc[mask]
+
+@st.cache_data
+def get_category_aggs(*filters):
+    """Category-level tables served from a single groupby over the filtered frame"""
+    df_filtered = filter_df(*filters)
+    grouped = df_filtered.groupby('Category', observed=True)
+    category_summary = grouped.agg({
+        'App': 'count',
+        'Rating': 'mean',
+        'Reviews': 'sum',
+        'Installs_Clean': 'sum'
+    })
+
+    category_table = category_summary.round(2)
+    category_table.columns = ['App Count', 'Avg Rating', 'Total Reviews', 'Total Installs']
+    # Groups come out in alphabetical order; a stable sort keeps tied
+    # categories in that order instead of letting quicksort shuffle them
+    return {
+        'counts': grouped.size().sort_values(ascending=False, kind='stable').head(10),
+        'ratings': category_summary['Rating'].sort_values(ascending=False, kind='stable').head(10),
+        'summary': category_table.sort_values('App Count', ascending=False, kind='stable')
+    }
+
+@st.cache_data
+def get_sentiment_means(*filters):
+    """Average polarity and positive/negative review percentages in one pass"""
+    df_filtered = filter_df(*filters)
+    return df_filtered[['sentiment_polarity_mean', 'positive_percentage', 'negative_percentage']].mean()
+
+@st.cache_data
+def get_sentiment_by_category(*filters):
+    """Top 10 categories by average positive review percentage"""
+    df_filtered = filter_df(*filters)
+    codes = df_filtered['Category'].cat.codes.to_numpy()
+    categories = df_filtered['Category'].cat.categories
+    # Same groups as groupby(observed=True): categories with at least one row
+    observed = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+
+    sentiment_by_category = pd.DataFrame({'Category': categories[observed]})
+    for col in ('positive_percentage', 'negative_percentage'):
+        values = df_filtered[col].to_numpy(dtype=np.float64)
+        sentiment_by_category[col] = bincount_mean(codes, values, len(categories))[observed]
+
+    return sentiment_by_category.sort_values('positive_percentage', ascending=False).head(10)
+
+@st.cache_data
+def top_performers(*filters):
+    """Top 10 apps by rating, installs and reviews from one shared column projection"""
+    df_filtered = filter_df(*filters)
+    sub = df_filtered[['App', 'Category', 'Rating', 'Reviews', 'Installs_Clean', 'Type']]
+    return {
+        'rating': sub.nlargest(10, 'Rating')[['App', 'Category', 'Rating', 'Reviews', 'Type']],
+        'installs': sub.nlargest(10, 'Installs_Clean')[['App', 'Category', 'Rating', 'Installs_Clean', 'Type']],
+        'reviews': sub.nlargest(10, 'Reviews')[['App', 'Category', 'Rating', 'Reviews', 'Type']]
+    }
+
+# Fixed bin edges and labels for the success factor charts
+PRICE_BINS = np.array([0, 0.01, 2, 5, 10, 100])
+PRICE_LABELS = ['Free', '$0-2', '$2-5', '$5-10', '$10+']
+SIZE_BINS = np.array([0, 10, 50, 100, 500])
+SIZE_LABELS = ['<10MB', '10-50MB', '50-100MB', '>100MB']
+
+def bincount_mean(idx, values, n_bins):
+    """Mean of values per integer bin index, NaN for empty bins"""
+    # Out-of-range indices and missing values are skipped, as groupby would
+    valid = (idx >= 0) & (idx < n_bins) & ~np.isnan(values)
+    sums = np.bincount(idx[valid], weights=values[valid], minlength=n_bins)
+    counts = np.bincount(idx[valid], minlength=n_bins)
+    return np.divide(sums, counts, out=np.full(n_bins, np.nan), where=counts > 0)
+
+def binned_mean(values, ratings, edges, labels):
+    """Mean rating per right-closed bin, matching pd.cut without the IntervalIndex"""
+    idx = np.searchsorted(edges, values, side='left') - 1
+    return pd.Series(bincount_mean(idx, ratings, len(edges) - 1), index=labels)
+
+@st.cache_data
+def get_success_factors(*filters):
+    """Average rating per price bin and per size bin"""
+    df_filtered = filter_df(*filters)
+    ratings = df_filtered['Rating'].to_numpy(dtype=np.float64)
+    return {
+        'price': binned_mean(df_filtered['Price_Clean'].to_numpy(), ratings, PRICE_BINS, PRICE_LABELS),
+        'size': binned_mean(df_filtered['Size_MB'].to_numpy(), ratings, SIZE_BINS, SIZE_LABELS)
+    }
+
+# Ratings move in 0.1 steps from 1 to 5; one bin per step, with edges half a
+# step either side, gives each rating value its own bar centred on its label.
+# Minimum Rating cuts fall between bins, so no bar is partially filtered.
+RATING_BINS = np.linspace(0.95, 5.05, 42)
+
+@st.cache_data
+def get_rating_histogram(*filters):
+    """Rating histogram bucket counts and edges, so the chart ships bins rather than rows"""
+    ratings = filter_df(*filters)['Rating'].to_numpy(dtype=np.float64)
+    return np.histogram(ratings[~np.isnan(ratings)], bins=RATING_BINS)
+
+@st.cache_data
+def filtered_csv_bytes(*filters):
+    """Filtered data serialized as UTF-8 CSV for the download button"""
+    df_filtered = filter_df(*filters)
+    return df_filtered.to_csv(index=False, columns=df_filtered.columns.drop('_app_lower')).encode('utf-8')
+
+@st.cache_data
+def sample_indices(n, k=1000, seed=0):
+    """Fixed random row positions so the scatter sample is stable across reruns"""
+    return np.random.default_rng(seed).choice(n, size=min(k, n), replace=False)
+
 # =============================================================================
 # SIDEBAR - FILTERS
 # =============================================================================
@@ -127,7 +283,7 @@ st.sidebar.markdown("---")
 st.sidebar.header(" Filters")
 
 # Category filter
-categories = ['All Categories'] + sorted(df['Category'].dropna().unique().tolist())
+categories = ['All Categories'] + stats['categories']
 selected_category = st.sidebar.selectbox("Category", categories)
 
 # Type filter
@@ -141,19 +297,11 @@ min_rating = st.sidebar.slider("Minimum Rating", 0.0, 5.0, 0.0, 0.5)
 min_reviews = st.sidebar.slider("Minimum Reviews", 0, 10000, 0, 100)
 
 # Apply filters
-df_filtered = df.copy()
-
-if selected_category != 'All Categories':
-    df_filtered = df_filtered[df_filtered['Category'] == selected_category]
-
-if selected_type != 'All Types':
-    df_filtered = df_filtered[df_filtered['Type'] == selected_type]
-
-df_filtered = df_filtered[df_filtered['Rating'] >= min_rating]
-df_filtered = df_filtered[df_filtered['Reviews'] >= min_reviews]
+filters = (selected_category, selected_type, min_rating, min_reviews)
+df_filtered = filter_df(*filters)
 
 st.sidebar.markdown("---")
-st.sidebar.markdown(f"**Showing:** {len(df_filtered):,} / {len(df):,} apps")
+st.sidebar.markdown(f"**Showing:** {len(df_filtered):,} / {stats['n']:,} apps")
 
 # =============================================================================
 # MAIN DASHBOARD
@@ -175,7 +323,7 @@ with col1:
     st.metric(
         label="Total Apps",
         value=f"{len(df_filtered):,}",
-        delta=f"{len(df_filtered) - len(df)}" if selected_category != 'All Categories' else None
+        delta=f"{len(df_filtered) - stats['n']}" if selected_category != 'All Categories' else None
     )
 
 with col2:
@@ -183,7 +331,7 @@ with col2:
     st.metric(
         label="Average Rating",
         value=f"{avg_rating:.2f} ",
-        delta=f"{avg_rating - df['Rating'].mean():+.2f}" if len(df_filtered) < len(df) else None
+        delta=f"{avg_rating - stats['mean_rating']:+.2f}" if len(df_filtered) < stats['n'] else None
     )
 
 with col3:
@@ -194,7 +342,7 @@ with col3:
     )
 
 with col4:
-    free_percentage = (df_filtered['Type'] == 'Free').sum() / len(df_filtered) * 100
+    free_percentage = df_filtered['Type'].value_counts(normalize=True, dropna=False).get('Free', 0.0) * 100
     st.metric(
         label="Free Apps",
         value=f"{free_percentage:.1f}%"
@@ -209,12 +357,13 @@ st.markdown("---")
 st.header(" Category Analysis")
 
 # Category performance
+category_aggs = get_category_aggs(*filters)
 col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("Top Categories by App Count")
     
-    category_counts = df_filtered['Category'].value_counts().head(10)
+    category_counts = category_aggs['counts']
     
     fig = px.bar(
         x=category_counts.values,
@@ -237,7 +386,7 @@ with col1:
 with col2:
     st.subheader("Average Rating by Category")
     
-    category_ratings = df_filtered.groupby('Category')['Rating'].mean().sort_values(ascending=False).head(10)
+    category_ratings = category_aggs['ratings']
     
     fig = px.bar(
         x=category_ratings.values,
@@ -260,24 +409,17 @@ with col2:
 # Category details table
 st.subheader(" Category Performance Summary")
 
-category_summary = df_filtered.groupby('Category').agg({
-    'App': 'count',
-    'Rating': 'mean',
-    'Reviews': 'sum',
-    'Installs_Clean': 'sum'
-}).round(2)
-
-category_summary.columns = ['App Count', 'Avg Rating', 'Total Reviews', 'Total Installs']
-category_summary = category_summary.sort_values('App Count', ascending=False)
+category_summary = category_aggs['summary']
 
 st.dataframe(
-    category_summary.style.format({
-        'App Count': '{:,.0f}',
-        'Avg Rating': '{:.2f}',
-        'Total Reviews': '{:,.0f}',
-        'Total Installs': '{:,.0f}'
-    }),
-    use_container_width=True
+    category_summary,
+    use_container_width=True,
+    column_config={
+        'App Count': st.column_config.NumberColumn(format='%d'),
+        'Avg Rating': st.column_config.NumberColumn(format='%.2f'),
+        'Total Reviews': st.column_config.NumberColumn(format='%d'),
+        'Total Installs': st.column_config.NumberColumn(format='%d')
+    }
 )
 
 st.markdown("---")
@@ -293,16 +435,19 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("Rating Distribution")
     
-    fig = px.histogram(
-        df_filtered,
-        x='Rating',
-        nbins=20,
-        labels={'Rating': 'App Rating', 'count': 'Number of Apps'},
-        color_discrete_sequence=['#667eea']
-    )
+    counts, edges = get_rating_histogram(*filters)
+    
+    fig = go.Figure(go.Bar(
+        x=np.round((edges[:-1] + edges[1:]) / 2, 1),
+        y=counts,
+        width=np.diff(edges),
+        marker_color='#667eea'
+    ))
     fig.update_layout(
         showlegend=False,
         height=400,
+        xaxis_title="App Rating",
+        yaxis_title="Number of Apps",
         font=dict(size=20),
         xaxis_title_font=dict(size=22),
         yaxis_title_font=dict(size=22)
@@ -313,7 +458,7 @@ with col2:
     st.subheader("Rating vs Reviews")
     
     # Sample for performance
-    sample_df = df_filtered.sample(min(1000, len(df_filtered)))
+    sample_df = df_filtered.iloc[sample_indices(len(df_filtered))]
     
     fig = px.scatter(
         sample_df,
@@ -344,9 +489,10 @@ st.markdown("---")
 st.header(" Sentiment Analysis")
 
 col1, col2, col3 = st.columns(3)
+sentiment_means = get_sentiment_means(*filters)
 
 with col1:
-    avg_polarity = df_filtered['sentiment_polarity_mean'].mean()
+    avg_polarity = sentiment_means['sentiment_polarity_mean']
     st.metric(
         label="Average Sentiment",
         value=f"{avg_polarity:.2f}",
@@ -354,14 +500,14 @@ with col1:
     )
 
 with col2:
-    avg_positive = df_filtered['positive_percentage'].mean()
+    avg_positive = sentiment_means['positive_percentage']
     st.metric(
         label="Positive Reviews",
         value=f"{avg_positive:.1f}%"
     )
 
 with col3:
-    avg_negative = df_filtered['negative_percentage'].mean()
+    avg_negative = sentiment_means['negative_percentage']
     st.metric(
         label="Negative Reviews",
         value=f"{avg_negative:.1f}%"
@@ -370,12 +516,7 @@ with col3:
 # Sentiment distribution
 st.subheader("Sentiment Distribution by Category")
 
-sentiment_by_category = df_filtered.groupby('Category').agg({
-    'positive_percentage': 'mean',
-    'negative_percentage': 'mean'
-}).reset_index()
-
-sentiment_by_category = sentiment_by_category.sort_values('positive_percentage', ascending=False).head(10)
+sentiment_by_category = get_sentiment_by_category(*filters)
 
 fig = go.Figure()
 fig.add_trace(go.Bar(
@@ -414,21 +555,19 @@ st.markdown("---")
 st.header("🏆 Top Performing Apps")
 
 tab1, tab2, tab3 = st.tabs(["By Rating", "By Installs", "By Reviews"])
+top_apps = top_performers(*filters)
 
 with tab1:
     st.subheader("Highest Rated Apps")
-    top_rated = df_filtered.nlargest(10, 'Rating')[['App', 'Category', 'Rating', 'Reviews', 'Type']]
-    st.dataframe(top_rated, use_container_width=True, hide_index=True)
+    st.dataframe(top_apps['rating'], use_container_width=True, hide_index=True)
 
 with tab2:
     st.subheader("Most Installed Apps")
-    top_installs = df_filtered.nlargest(10, 'Installs_Clean')[['App', 'Category', 'Rating', 'Installs_Clean', 'Type']]
-    st.dataframe(top_installs, use_container_width=True, hide_index=True)
+    st.dataframe(top_apps['installs'], use_container_width=True, hide_index=True)
 
 with tab3:
     st.subheader("Most Reviewed Apps")
-    top_reviews = df_filtered.nlargest(10, 'Reviews')[['App', 'Category', 'Rating', 'Reviews', 'Type']]
-    st.dataframe(top_reviews, use_container_width=True, hide_index=True)
+    st.dataframe(top_apps['reviews'], use_container_width=True, hide_index=True)
 
 st.markdown("---")
 
@@ -439,14 +578,15 @@ st.markdown("---")
 st.header(" Success Factor Analysis")
 
 col1, col2 = st.columns(2)
+success_factors = get_success_factors(*filters)
 
 with col1:
     st.subheader("Price vs Rating")
     
-    price_rating = df_filtered.groupby(pd.cut(df_filtered['Price_Clean'], bins=[0, 0.01, 2, 5, 10, 100]))['Rating'].mean()
+    price_rating = success_factors['price']
     
     fig = px.bar(
-        x=['Free', '$0-2', '$2-5', '$5-10', '$10+'],
+        x=PRICE_LABELS,
         y=price_rating.values,
         labels={'x': 'Price Range', 'y': 'Average Rating'},
         color=price_rating.values,
@@ -464,10 +604,10 @@ with col1:
 with col2:
     st.subheader("Size vs Rating")
     
-    size_rating = df_filtered.groupby(pd.cut(df_filtered['Size_MB'], bins=[0, 10, 50, 100, 500]))['Rating'].mean()
+    size_rating = success_factors['size']
     
     fig = px.bar(
-        x=['<10MB', '10-50MB', '50-100MB', '>100MB'],
+        x=SIZE_LABELS,
         y=size_rating.values,
         labels={'x': 'App Size', 'y': 'Average Rating'},
         color=size_rating.values,
@@ -523,7 +663,8 @@ st.subheader("Search Apps")
 search_query = st.text_input("Enter app name to search", "")
 
 if search_query:
-    search_results = df_filtered[df_filtered['App'].str.contains(search_query, case=False, na=False)]
+    search_mask = df_filtered['_app_lower'].str.contains(search_query.lower(), regex=False, na=False)
+    search_results = df_filtered[search_mask]
     st.write(f"Found {len(search_results)} apps")
     st.dataframe(
         search_results[['App', 'Category', 'Rating', 'Reviews', 'Installs_Clean', 'Type', 'Price_Clean']].head(20),
@@ -533,16 +674,17 @@ if search_query:
 
 # Raw data viewer
 with st.expander(" View Raw Data"):
-    st.dataframe(df_filtered.head(100), use_container_width=True)
+    data_columns = df_filtered.columns.drop('_app_lower')
+    st.dataframe(df_filtered.head(100)[data_columns], use_container_width=True)
     
-    # Download button
-    csv = df_filtered.to_csv(index=False)
-    st.download_button(
-        label=" Download Filtered Data as CSV",
-        data=csv,
-        file_name="apppulse_filtered_data.csv",
-        mime="text/csv"
-    )
+    # Download button, serialized only once the user asks for it
+    if st.checkbox("Prepare CSV download"):
+        st.download_button(
+            label=" Download Filtered Data as CSV",
+            data=filtered_csv_bytes(*filters),
+            file_name="apppulse_filtered_data.csv",
+            mime="text/csv"
+        )
 
 # =============================================================================
 # FOOTER